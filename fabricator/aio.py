@@ -0,0 +1,129 @@
+import inspect
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .fabricator import Fabricator, FabricatorEndpoint, _MISSING
+
+# Connection limits for the aiohttp.ClientSession shared by every endpoint in an AsyncFabricator tree
+CONNECTOR_LIMIT = 100
+KEEPALIVE_TIMEOUT = 75
+
+
+def make_async_session():
+    """
+    Creates an aiohttp.ClientSession with a keep-alive connection pool. Must be called from a running event loop.
+    :return aiohttp.ClientSession: The new session
+    """
+    connector = aiohttp.TCPConnector(limit=CONNECTOR_LIMIT, keepalive_timeout=KEEPALIVE_TIMEOUT)
+    # Like the requests.Session behind Fabricator, the session doesn't keep cookies between calls
+    return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+
+def make_response(prepared, resp, body):
+    """
+    Builds a requests.Response from an aiohttp response, so that response handlers (including the ones in
+    fabricator.extras) work the same way with AsyncFabricator as they do with Fabricator
+    :param requests.PreparedRequest prepared: The request that was sent
+    :param aiohttp.ClientResponse resp: The response that came back
+    :param bytes body: The response body, already read
+    :return requests.Response: The equivalent requests response
+    """
+    response = requests.Response()
+    response.status_code = resp.status
+    response.reason = resp.reason
+    # Repeated headers (e.g. Set-Cookie) are joined the way requests joins them
+    response.headers = CaseInsensitiveDict((name, ', '.join(resp.headers.getall(name))) for name in resp.headers)
+    response.url = str(resp.url)
+    response.encoding = resp.charset
+    response.request = prepared
+    # The body has already been read, so iter_content() and iter_lines() serve it from _content
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+# The AsyncFabricatorEndpoint works exactly like FabricatorEndpoint, except that calling it returns a coroutine
+class AsyncFabricatorEndpoint(FabricatorEndpoint):
+    __slots__ = ()
+
+    async def _make_request(self, method, **kwargs):
+        method, url, options = self._prepare_request(method, **kwargs)
+
+        key = self._cache_key(method, url, options)
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
+
+        # Let requests prepare the request so that auth handlers (which expect a requests request) keep working
+        prepared = requests.Request(method, url, **options).prepare()
+
+        session = self.parent._get_session()
+        async with session.request(prepared.method, prepared.url, headers=dict(prepared.headers), data=prepared.body) as resp:
+            # Read the body before the connection is released
+            body = await resp.read()
+
+        resp = make_response(prepared, resp, body)
+
+        # Handlers can be plain functions or coroutines
+        result = self._resolved_handler(resp)
+        if inspect.isawaitable(result):
+            result = await result
+
+        self._cache_put(key, resp, result)
+        return result
+
+
+class AsyncFabricator(Fabricator):
+    """
+    An asyncio version of Fabricator backed by aiohttp. Endpoints are registered exactly as they are with Fabricator,
+    but calling an endpoint returns a coroutine, so independent requests can be run concurrently:
+
+        await asyncio.gather(*(client.todos.create(value=v) for v in values))
+
+    Response handlers receive a requests.Response, just as they do with Fabricator, and may also be coroutines.
+    Use the client as an async context manager (or await close()) to release its connections.
+    """
+    _endpoint_class = AsyncFabricatorEndpoint
+
+    def _start_session(self):
+        # The aiohttp session has to be created inside a running event loop, so it's created on the first request
+        pass
+
+    def _get_session(self):
+        root = self._find_root()
+        if root._session is None or root._session.closed:
+            root._session = make_async_session()
+        return root._session
+
+    async def close(self, **kwargs):
+        """
+        Closes the aiohttp session shared by the client
+        """
+        if self._is_started() and 'close' in self._endpoints:
+            # An endpoint called close was registered, so this was intended to be an endpoint call
+            return await self._endpoints['close'](**kwargs)
+
+        await self._close_session()
+
+    async def _close_session(self):
+        root = self._find_root()
+        if root._session is not None:
+            await root._session.close()
+            root._session = None
+
+    def __enter__(self):
+        raise TypeError('AsyncFabricator must be used with "async with", not "with"')
+
+    def __exit__(self, *exc_info):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._close_session()
+
+
+AsyncFabricator._group_class = AsyncFabricator
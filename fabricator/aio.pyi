@@ -0,0 +1,31 @@
+from typing import Any, AnyStr, Dict, NoReturn, Optional, Type
+
+import aiohttp
+import requests
+
+from .fabricator import Fabricator, FabricatorEndpoint
+
+CONNECTOR_LIMIT: int
+KEEPALIVE_TIMEOUT: int
+
+def make_async_session() -> aiohttp.ClientSession: ...
+def make_response(prepared: requests.PreparedRequest, resp: aiohttp.ClientResponse, body: bytes) -> requests.Response: ...
+
+
+class AsyncFabricatorEndpoint(FabricatorEndpoint):
+    async def _make_request(self, method: AnyStr, **kwargs: Dict[AnyStr, Any]) -> Any: ...
+
+
+class AsyncFabricator(Fabricator):
+    _endpoint_class: Type[AsyncFabricatorEndpoint]
+    _group_class: Type['AsyncFabricator']
+    _session: Optional[aiohttp.ClientSession]
+
+    def _start_session(self) -> None: ...
+    def _get_session(self) -> aiohttp.ClientSession: ...
+    async def close(self, **kwargs: Any) -> Any: ...
+    async def _close_session(self) -> None: ...
+    def __enter__(self) -> NoReturn: ...
+    def __exit__(self, *exc_info: Any) -> None: ...
+    async def __aenter__(self) -> 'AsyncFabricator': ...
+    async def __aexit__(self, *exc_info: Any) -> None: ...
@@ -1,4 +1,4 @@
-from .fabricator import FabricatorRequestError, FabricatorRequestAuthError
+from .fabricator import FabricatorRequestError, FabricatorRequestAuthError, _json
 
 # Simple response handlers that are available for use by clients when they define themselves
 # ------------------------------------------------------------------------------------------------------------
@@ -6,11 +6,12 @@ def handler_json_decode(resp):
     """
     If no Fabricator response handler is provided, this one will be used by default.
     It will attempt to decode a JSON response, and will then return the result.
+    The raw body bytes are decoded directly, so no intermediate str copy of the body is made.
     """
     resp = handler_check_ok(resp)
     try:
-        # Try to decode and return a JSON response
-        return resp.json(), resp.status_code
+        # Try to decode and return a JSON response. The decoder is fed the raw bytes, skipping the str decode resp.json() does.
+        return _json.loads(resp.content), resp.status_code
     except ValueError:
         return resp.content, resp.status_code
 
@@ -1,48 +1,28 @@
-from __future__ import (absolute_import, division,
-                        print_function, unicode_literals)
-
 from .__version__ import __version__
 
+import collections
+import enum
 import functools
-import json
+import http.cookiejar
 import re
-from builtins import *
+import threading
+import time
 
 import requests
-import six
-from future.utils import raise_from
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 
-if six.PY2:
-    import aenum as enum
-elif six.PY3:
-    import enum
+# Use the fastest available JSON decoder. orjson and ujson both accept the raw bytes of a response body.
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
 
 
 # Utilities
-def extract_parameters(kwargs, names, remove=False):
-    """
-    In a few cases, because of the dual modes of Fabricator, we need to allow
-    any set of parameters to be passed into a method in one mode, while requiring
-    parameters in another. This makes dealing with that situation a bit easier.
-
-    TODO(blevenson): This has one downside - None is used as the initializer, 
-    which will make it impossible to set the value of one of the parameters to
-    None intentionally. Need to think about how to handle this situation.
-    """
-    out = [None] * len(names)
-    for i, n in enumerate(names):
-        if n in kwargs:
-            out[i] = kwargs[n]
-            if remove:
-                del kwargs[n]
-
-    return tuple(out)
-
-def destructure_dict(d, *args, default=None):
-    return tuple(d.get(a, default) for a in args)
-
-
 def check_valid_methods(methods):
     for i, m in enumerate(methods):
         # Skip check if already an instance of HTTPMethods
@@ -53,13 +33,7 @@ def check_valid_methods(methods):
             m = HTTPMethods(m)
             methods[i] = m
         except ValueError as exc:
-            raise_from(FabricatorNotImplementedError('method "{}" is not valid'.format(m)), exc)
-
-def add_if_set(kw, **kwargs):
-    for n, v in kwargs.items():
-        if v is not None:
-            kw[n] = v
-    return kw
+            raise FabricatorNotImplementedError('method "{}" is not valid'.format(m)) from exc
 
 def check_required_params(missing_values=(None,), **kwargs):
     for n, v in kwargs.items():
@@ -67,7 +41,7 @@ def check_required_params(missing_values=(None,), **kwargs):
             raise ValueError('missing required keyword parameter "{}"'.format(n))
 
 # Custom Exceptions and Error Types
-quote_and_escape = lambda s: "'{}'".format(s.replace("'", r"\'")) if s is not None else 'None'
+quote_and_escape = lambda s: 'None' if s is None else repr(s)
 
 class FabricatorException(Exception):
     pass
@@ -77,16 +51,18 @@ class FabricatorNotImplementedError(FabricatorException):
 
 class FabricatorRequestError(FabricatorException):
     def __init__(self, message=None, code=None, content=None):
-        FabricatorException.__init__(self, message)
+        super().__init__(message)
         self.message = message
         self.code = code
         self.content = content
 
-    @property
+    @functools.cached_property
     def json(self):
+        # Cached, since __str__ uses this and error content can be large
         try:
-            return json.loads(self.content)
-        except:
+            return _json.loads(self.content)
+        except (TypeError, ValueError):
+            # Not JSON (decode errors are ValueErrors in every decoder we use), or no content at all
             return self.content
 
 
@@ -101,7 +77,7 @@ class FabricatorRequestError(FabricatorException):
 
 class FabricatorRequestAuthError(FabricatorRequestError):
     def __init__(self, code=None, content=None):
-        FabricatorRequestError.__init__(self, code=code, content=content)
+        super().__init__(code=code, content=content)
         self.message = 'Authentication failed'
 
 class FabricatorUsageError(FabricatorException):
@@ -109,7 +85,7 @@ class FabricatorUsageError(FabricatorException):
 
 class FabricatorParamValidationError(FabricatorUsageError):
     def __init__(self, param=None, *args, **kwargs):
-        super(FabricatorParamValidationError, self).__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.param = param
 
     def __repr__(self):
@@ -119,8 +95,70 @@ class FabricatorParamValidationError(FabricatorUsageError):
         return 'required parameter {} is missing'.format(self.param)
 
 
+# Connection pool sizing for the requests.Session shared by every endpoint in a Fabricator tree
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 50
+
+def make_session():
+    """
+    Creates a requests.Session with an explicitly sized connection pool mounted for http and https
+    :return requests.Session: The new session
+    """
+    session = requests.Session()
+    # Endpoints share the session, but not cookies. A cookie set by one response would otherwise be sent with
+    # every later call in the tree, whatever auth handler that call uses.
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=()))
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Only responses to these methods are ever cached by an endpoint's ResponseCache
+_CACHEABLE_METHODS = frozenset(('GET', 'HEAD'))
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of handled responses, with an optional time-to-live for each entry
+    """
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the cached value for key, or _MISSING if there isn't one (or it has expired)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+
+            deadline, value = entry
+            if deadline is not None and deadline < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        deadline = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (deadline, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 # HTTPMethods is used to ensure correct method names are being used when registering request methods and calling them
-class HTTPMethods(enum.Enum):
+class HTTPMethods(str, enum.Enum):
     """The set of valid HTTP methods"""
     # Most commonly used for REST APIs
     GET = 'GET'
@@ -135,37 +173,65 @@ class HTTPMethods(enum.Enum):
     CONNECT = 'CONNECT'
     TRACE = 'TRACE'
 
-    def __eq__(self, other):
-        if self is other:
-            return True
-
-        if self.value == other:
-            return True
-
-        return False
-
     @staticmethod
     def all():
-        return tuple(v for v in dir(HTTPMethods) if not v.startswith('__'))
+        return _HTTP_METHOD_NAMES
+
+# The names of all valid HTTP methods, computed once for fast membership checks
+_HTTP_METHOD_NAMES = frozenset(m.name for m in HTTPMethods)
+_HTTP_METHOD_NAMES_LOWER = ', '.join(sorted(_HTTP_METHOD_NAMES)).lower()
+
+# Methods whose keyword arguments are sent as a JSON body rather than as query string params
+_BODY_METHODS = frozenset(('POST', 'PUT', 'PATCH'))
 
 noop_auth_handler = lambda r: r
 
+# Sentinel for missing keyword arguments, since None is a valid value
+_MISSING = object()
+
+# Matches URL params in endpoint paths (e.g. ":id" in "/todos/:id"), capturing the param name
+_URL_PARAM_RE = re.compile(r':([A-Za-z_]+)')
+
+
+class AuthReady(AuthBase):
+    """
+    Adapts an auth handler function to the AuthBase interface requests expects
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, req):
+        return self.f(req)
+
 
 def make_auth_handler(f):
     """
-    Creates an AuthBase class
+    Creates an AuthBase instance
     :param callable or AuthBase f: The function that will process the request and add auth details
-    :return AuthBase: The AuthBase class
+    :return AuthBase: The AuthBase instance
     """
-    class AuthReady(AuthBase):
-        def __call__(self, req):
-            return f(req)
+    # requests can use AuthBase instances directly, so there's no need to wrap them
+    if isinstance(f, AuthBase):
+        return f
+    return AuthReady(f)
+
 
-    return AuthReady
+# Shared by every endpoint that has no auth handler in its tree. Passing an auth object (rather than None) also
+# keeps requests from falling back to looking up credentials in ~/.netrc on every request.
+_NO_AUTH = AuthReady(noop_auth_handler)
 
 # The FabricatorEndpoint type represents a particular 'path' and HTTP method (or route in ReST terms) that requests can be sent to.
 # This class actually makes the requests that occur in this library.
 class FabricatorEndpoint:
+    # Endpoints are numerous and read on every request, so they don't get a __dict__. The per-method callers bound
+    # in __init__ get a slot for every HTTP method name; unbound ones fall through to __getattr__.
+    _state_slots = ('parent', 'name', 'path', 'handler', 'methods', 'auth_handler', 'headers', 'required_params',
+                    '_methods_set', '_kwargs_option', '_required_params_set', '_cache',
+                    '_url_param_names', '_url_param_tokens', '_path_template',
+                    '_resolved', '_resolved_handler', '_resolved_auth', '_resolved_headers', '_resolved_base_url',
+                    '_base_options')
+    __slots__ = _state_slots + tuple(m.name for m in HTTPMethods) + tuple(m.name.lower() for m in HTTPMethods)
+
     def __init__(self,
                  parent,
                  name=None,
@@ -174,24 +240,78 @@ class FabricatorEndpoint:
                  methods=None,
                  auth_handler=None,
                  headers=None,
-                 required_params=()):
+                 required_params=(),
+                 cache=None,
+                 cache_ttl=None):
         """
         This creates a "Route" (really a known operation) within the Fabricator where it lives.
         """
         check_required_params(name=name, path=path)
+        if cache_ttl is not None and not cache:
+            raise FabricatorUsageError('cache_ttl requires cache to be set')
 
         self.parent = parent
         self.name = name
         self.path = path
         self.handler = handler
         self.methods = methods
+        self._methods_set = frozenset(methods or ())
+        if cache and not self._methods_set & _CACHEABLE_METHODS:
+            raise FabricatorUsageError('cache requires a GET or HEAD method, since only their responses are cached')
+
+        # Whether the remaining kwargs of a call go in the JSON body or the query string, decided once per method
+        self._kwargs_option = {m: 'json' if m in _BODY_METHODS else 'params' for m in self._methods_set}
         self.auth_handler = auth_handler
         self.headers = headers
         self.required_params = required_params
+        self._required_params_set = frozenset(required_params or ())
+
+        # Handled GET and HEAD responses are cached when a cache size is given
+        self._cache = ResponseCache(cache, ttl=cache_ttl) if cache else None
+
+        # The URL params in the path never change, so find them once here rather than on every request
+        self._url_param_names = tuple(_URL_PARAM_RE.findall(path))
+        self._url_param_tokens = tuple(':' + n for n in self._url_param_names)
+
+        # The path as a str.format template (e.g. "/todos/{id}") so URL params are filled in with a single pass
+        self._path_template = _URL_PARAM_RE.sub(r'{\1}', path.replace('{', '{{').replace('}', '}}'))
+
+        # Settings inherited from the parent chain are cached here by _resolve()
+        self._resolved = False
+        self._resolved_handler = None
+        self._resolved_auth = None
+        self._resolved_headers = None
+        self._resolved_base_url = None
+        self._base_options = None
+
+        self._bind_methods()
+
+    def _bind_methods(self):
+        # Bind a caller for each method (e.g. endpoint.put and endpoint.PUT) so they don't go through __getattr__
+        for m in self.methods or ():
+            caller = functools.partial(self._make_request, method=m)
+            setattr(self, m.lower(), caller)
+            setattr(self, m, caller)
+
+    def __getstate__(self):
+        # Only the slots set in __init__. The method slots that aren't bound would fall through to __getattr__, and
+        # the ones that are are bound to this instance, so __setstate__ binds them again instead.
+        return None, {name: getattr(self, name) for name in self._state_slots}
+
+    def __setstate__(self, state):
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._bind_methods()
 
     def __getattr__(self, item):
-        self._check_method(item)
-        return functools.partial(self._make_request, method=item)
+        # Only reached for methods that weren't bound in __init__, which are either invalid or oddly cased.
+        # Python looks up dunder names like __dict__ (absent because of __slots__) and expects AttributeError.
+        if item.startswith('__'):
+            raise AttributeError(item)
+
+        method = item.upper()
+        self._check_method(method)
+        return functools.partial(self._make_request, method=method)
 
     def __call__(self, *args, **kwargs):
         """
@@ -201,12 +321,9 @@ class FabricatorEndpoint:
 
     def _check_method(self, m):
         """
-        Checks to make sure that the provided method is valid for this route
+        Checks to make sure that the provided method (an uppercased string) is valid for this route
         """
-        if isinstance(m, str):
-            m = m.upper()
-
-        if self.methods and m not in self.methods:
+        if m not in self._methods_set:
             raise FabricatorNotImplementedError('{} is not a valid method for the {} route'.format(m, self.path))
 
     def _get_response_handler(self):
@@ -214,11 +331,7 @@ class FabricatorEndpoint:
             return self.handler
 
         # No handler set on the route itself, so we need to look at the Fabricator parent, etc
-        current = self.parent
-        handler = None
-        while handler is None and current is not None:
-            handler = current._default_handler
-            current = current._parent
+        handler = next((f._default_handler for f in self.parent._chain if f._default_handler is not None), None)
 
         return handler or noop_response_handler # If no handler found in tree, default to noop response handler
 
@@ -226,93 +339,138 @@ class FabricatorEndpoint:
         if self.auth_handler is not None:
             return make_auth_handler(self.auth_handler)
 
-        current = self.parent
-        auth_handler = None
-        while auth_handler is None and current is not None:
-            auth_handler = current._auth_handler
-            current = current._parent
+        auth_handler = next((f._auth_handler for f in self.parent._chain if f._auth_handler is not None), None)
 
-        ah = auth_handler or noop_auth_handler
-        return make_auth_handler(ah)
+        if auth_handler is None:
+            return _NO_AUTH
+        return make_auth_handler(auth_handler)
 
     def _get_headers(self):
         if self.headers is not None:
             return self.headers
 
-        current = self.parent
-        headers = None
-        while headers is None and current is not None:
-            headers = current._headers
-            current = current._parent
+        headers = next((f._headers for f in self.parent._chain if f._headers is not None), None)
+        return headers or {}
 
-        h = headers or {}
-        return h
+    def _get_base_url(self):
+        # Construct the full URL base by joining the base_url values of the Fabricator instance chain, root first
+        return ''.join(f._base_url for f in reversed(self.parent._chain))
+
+    def _resolve(self):
+        """
+        Walks the parent chain once and caches the handler, auth, headers and base URL this
+        endpoint inherits. The tree can't change once started, so Fabricator.start() calls this
+        for every endpoint and requests don't have to walk the chain again. Before start() the
+        tree can still change, so the settings are used for one call only and not marked resolved.
+        """
+        self._resolved_handler = self._get_response_handler()
+        self._resolved_auth = self._get_auth_handler()
+        # The headers dict is kept by reference, so changes made to it after start() (e.g. a refreshed
+        # Authorization token) are sent with later requests
+        self._resolved_headers = self._get_headers()
+        self._resolved_base_url = self._get_base_url()
+        self._base_options = {'auth': self._resolved_auth, 'headers': self._resolved_headers}
+        self._resolved = self.parent._is_started()
 
     def _construct_url(self, url_params=None):
+        # Paths without URL params (e.g. "/__health") are used as is
+        if not self._url_param_names:
+            return self._resolved_base_url + self.path
+
         # Handle URL params as necessary
-        path = self.path
-        for k, v in url_params.items():
-            try:
-                v = str(v)
-            except:
-                raise FabricatorUsageError('URL parameter could not be converted to str')
+        try:
+            path = self._path_template.format_map(url_params or {})
+        except Exception as exc:
+            raise FabricatorUsageError('URL parameter could not be converted to str') from exc
 
-            path = path.replace(k, v)
+        return self._resolved_base_url + path
 
-        # Construct the full URL base by climbing through the Fabricator instance chain and adding together the base_url values
-        current = self.parent
-        base_url = ''
-        while current is not None:
-            base_url = current._base_url + base_url
-            current = current._parent
+    def _make_request(self, method, **kwargs):
+        method, url, options = self._prepare_request(method, **kwargs)
 
-        return '{}{}'.format(base_url, path)
+        key = self._cache_key(method, url, options)
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
 
-    def _make_request(self, method, **kwargs):
-        # Check to ensure the method is valid
-        self._check_method(method)
+        # Get session and request base from the Fabricator this route belongs to
+        session = self.parent._get_session()
+        resp = session.request(method, url, **options)
+        result = self._resolved_handler(resp)
 
-        if isinstance(method, HTTPMethods):
-            # method is actually a HTTPMethod enum, so get the string representation
-            method = method.value
-        elif isinstance(method, six.string_types):
-            # method is already a string, make sure its uppercased the way that requests likes it
-            method = method.upper()
-        else:
-            # Something went very very wrong if we're here. Most likely the user called _make_request directly. Bad user!
-            raise FabricatorException('"method" ({}) is an invalid type: {}'.format(method, type(method)))
+        self._cache_put(key, resp, result)
+        return result
+
+    def _cache_key(self, method, url, options):
+        """
+        Returns the key a call is cached under, or None if the call can't be cached
+        """
+        if self._cache is None or method not in _CACHEABLE_METHODS:
+            return None
+
+        key = (method, url, tuple(sorted(options.get('params', {}).items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Some query param values (e.g. lists) can't be part of a key
+            return None
+        return key
+
+    def _cache_get(self, key):
+        """
+        Returns the cached result for a key from _cache_key, or _MISSING if there isn't one
+        """
+        if key is None:
+            return _MISSING
+        return self._cache.get(key)
+
+    def _cache_put(self, key, resp, result):
+        """
+        Caches the handled result of a response under a key from _cache_key, if the response can be cached
+        """
+        # Only successful responses are cached, so a transient error isn't returned from then on
+        if key is not None and resp.ok and 'no-store' not in resp.headers.get('Cache-Control', ''):
+            self._cache.put(key, result)
+
+    def _prepare_request(self, method, **kwargs):
+        """
+        Validates the call and works out everything needed to send it. Kept separate from
+        the transport so that other transports (see fabricator.aio) can share it.
+        Returns a (method, url, options) tuple where options are keyword arguments for requests.
+        """
+        # Endpoints are normally resolved by start(), but may be called directly before that, in which case
+        # settings are worked out again on every call
+        if not self._resolved:
+            self._resolve()
+
+        # Check to ensure the method is valid. Methods are normalized to uppercased strings at registration.
+        self._check_method(method)
 
         # Check that all required arguments are present and accounted for
-        for p in self.required_params:
-            if p not in kwargs:
-                raise FabricatorParamValidationError(param=p)
+        if self._required_params_set:
+            missing = self._required_params_set.difference(kwargs)
+            if missing:
+                # Report the first missing param in the order they were declared
+                raise FabricatorParamValidationError(param=next(p for p in self.required_params if p in missing))
 
         # Before we continue, we need to check the path and see if it has any URL params in it, If so, we need to try to find those params in kwargs
         url_params = {}
-        matches = re.findall('(:[A-z_]+)', self.path)
-        for m in matches:
-            if m[1:] not in kwargs:
-                raise FabricatorParamValidationError(param=m)
-
-            # Add to url_params and delete from kwargs
-            url_params[m] = kwargs[m[1:]]
-            del kwargs[m[1:]]
-
-        options = {}
+        for name, token in zip(self._url_param_names, self._url_param_tokens):
+            # Move the URL param out of kwargs
+            value = kwargs.pop(name, _MISSING)
+            if value is _MISSING:
+                raise FabricatorParamValidationError(param=token)
+            url_params[name] = value
+
+        # Headers and auth are always the same, so calls without kwargs share the endpoint's options
+        # (they are only ever unpacked, never modified)
+        options = self._base_options
         if kwargs:
-            if method in (HTTPMethods.POST, HTTPMethods.PUT, HTTPMethods.PATCH):
-                options['json'] = kwargs
-            else:
-                # TODO: When passing query string params, need to make sure all values in kwargs are ok in terms of type
-                options['params'] = kwargs
+            options = dict(options)
+            # TODO: When passing query string params, need to make sure all values in kwargs are ok in terms of type
+            options[self._kwargs_option[method]] = kwargs
 
-        # Now we want to set up headers and auth
-        options['auth'] = self._get_auth_handler()()
-        options['headers'] = self._get_headers()
-
-        # Get session and request base from the Fabricator this route belongs to
-        resp = requests.request(method, self._construct_url(url_params=url_params), **options)
-        return self._get_response_handler()(resp)
+        return method, self._construct_url(url_params=url_params), options
 
 
 # The noop handler is the default if no other handler is provided. It is just a passthrough.
@@ -327,6 +485,11 @@ class Fabricator:
     1) In its initial mode, it allows endpoints to be registered to the client. Then, once .start() is called,
     2) It allows an end user to use those endpoints to contact an API
     """
+    # The classes used for endpoints and groups registered on this Fabricator. _group_class is set once the class
+    # exists, below, so subclasses with their own __init__ still get plain Fabricator groups.
+    _endpoint_class = FabricatorEndpoint
+    _group_class = None
+
     def __init__(self,
                  base_url,
                  auth_handler=None,
@@ -339,20 +502,40 @@ class Fabricator:
         self._headers = headers
         self._default_handler = handler
 
+        # The tree only grows downwards, so the path up to the root is fixed when a Fabricator is created.
+        # _chain runs from this instance up to the root.
+        self._root = self if parent is None else parent._root
+        self._chain = (self,) if parent is None else (self,) + parent._chain
+
         # Initialize the routes dict
         self._endpoints = {}
+
+        # Only the root's flag is used. Every Fabricator in the tree can read it directly through _root.
         self._started = False
 
+        # Registration proxies returned in builder mode (e.g. for .get and .post), created on first use
+        self._builders = {}
+
+        # The requests.Session is only ever set on the root, and is created by start()
+        self._session = None
+
     def __getattr_builder(self, name):
         """
         Looks up the correct attribute in "builder" mode. That is, finds the 
         correct HTTP method and returns a proxy to the register method.
         """
-        if name.upper() not in HTTPMethods.all():
-            all_methods = ', '.join(HTTPMethods.all()).lower()
-            raise FabricatorUsageError('Endpoint registrations use the methods "{}"'.format(all_methods))
-
-        return functools.partial(self.register, methods=[HTTPMethods(name.upper())])
+        builder = self._builders.get(name)
+        if builder is not None:
+            return builder
+
+        # Finds the enum member and validates the name in a single lookup
+        method = HTTPMethods.__members__.get(name.upper())
+        if method is None:
+            raise FabricatorUsageError('Endpoint registrations use the methods "{}"'.format(_HTTP_METHOD_NAMES_LOWER))
+
+        # Cache the proxy so registering more endpoints with the same method reuses it
+        builder = self._builders[name] = functools.partial(self.register, methods=(method,))
+        return builder
     
     def __getattr_started(self, name):
         """
@@ -370,7 +553,11 @@ class Fabricator:
         a) Finds the appropriate route based on the name of the attribute
         b) If the attr is the name of a HTTP Method, it will call register with that method
         """
-        if self._is_started():
+        if self._root._started:
+            # Fast path for the common case of calling an endpoint on a started client
+            endpoint = self._endpoints.get(name)
+            if endpoint is not None:
+                return endpoint
             return self.__getattr_started(name)
         return self.__getattr_builder(name)
 
@@ -434,13 +621,12 @@ class Fabricator:
             return self.__getattr_started('group')(**kwargs)
 
         # Create the new Fabricator instance with self as the parent
-        name, prefix = destructure_dict(kwargs, 'name', 'prefix')
-        del kwargs['name']
+        name = kwargs.pop('name')
+        prefix = kwargs.pop('prefix', None)
         if prefix is not None:
             # In 'group' we call the 'base_url' a 'prefix'. Translate before calling.
             kwargs['base_url'] = prefix
-            del kwargs['prefix']
-        self._endpoints[name] = Fabricator(parent=self, **kwargs)
+        self._endpoints[name] = self._group_class(parent=self, **kwargs)
 
         # Return it to the caller so they can use it
         return self._endpoints[name]
@@ -458,27 +644,69 @@ class Fabricator:
         # Not yet started, so do so. If this is called on a group, rather than
         # a parent, the root will be found so the entire client is started as
         # well.
-        self._find_root()._started = True
-    
+        root = self._find_root()
+        root._started = True
+        root._resolve_endpoints()
+        root._start_session()
+
+    def _start_session(self):
+        """
+        Called on the root by start(). Creates the shared session up front so every endpoint reuses its connection pool.
+        """
+        self._get_session()
+
+    def _resolve_endpoints(self):
+        """
+        Resolves every endpoint in this Fabricator and its groups
+        """
+        for endpoint in self._endpoints.values():
+            if isinstance(endpoint, Fabricator):
+                endpoint._resolve_endpoints()
+            else:
+                endpoint._resolve()
+
+    def _get_session(self):
+        """
+        Returns the requests.Session shared by the whole Fabricator tree. The
+        session lives on the root and is created on first use if start() has
+        not created it yet.
+        """
+        root = self._find_root()
+        if root._session is None:
+            root._session = make_session()
+        return root._session
+
+    def close(self, **kwargs):
+        """
+        Closes the requests.Session shared by the client, releasing its pooled connections
+        """
+        if self._is_started() and 'close' in self._endpoints:
+            # An endpoint called close was registered, so this was intended to be an endpoint call
+            return self.__getattr_started('close')(**kwargs)
+
+        self._close_session()
+
+    def _close_session(self):
+        root = self._find_root()
+        if root._session is not None:
+            root._session.close()
+            root._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._close_session()
+
     def _find_root(self):
         """
-        If the current instance is a child group, work up to the root and then
-        return the root instance
+        If the current instance is a child group, return the root instance
         """
-        current = self
-        while current._parent:
-            current = current._parent
-        return current
+        return self._root
 
     def _is_started(self):
-        # Work up through the tree, checking to see if the Fabricator is marked as "ready"
-        current = self
-        while current is not None:
-            if current._started:
-                return True
-            current = current._parent
-
-        return False
+        # The started flag lives on the root, which every Fabricator points to directly
+        return self._root._started
 
     def standard(self, with_param=None, **kwargs):
         """
@@ -495,7 +723,8 @@ class Fabricator:
         """
         if self._is_started():
             # Fabricator client has been started, so pass off control
-            kwargs = add_if_set(kwargs, with_param=with_param)
+            if with_param is not None:
+                kwargs['with_param'] = with_param
             return self.__getattr_started('standard')(**kwargs)
 
         # Create the All and Create methods
@@ -522,23 +751,30 @@ class Fabricator:
         auth_handler (Callable): A handler that should be applied to the request to handle authentication
         headers (Dict): Headers that should be added to the request
         required_params (List[str]): A list of parameters that must be present when this endpoint is called 
+        cache (int): If set, up to this many handled GET and HEAD responses are cached, keyed by URL and params
+        cache_ttl (float): How many seconds a cached response stays valid. By default entries don't expire.
         """
         # Check for started
         if self._is_started():
             return self.__getattr_started('register')(**kwargs)
         
-        name, path, methods = destructure_dict(kwargs, 'name', 'path', 'methods')
+        name = kwargs.get('name')
+        path = kwargs.get('path')
+        methods = kwargs.get('methods')
         
-        # Check that the provided methods are valid
+        # Check that the provided methods are valid, then store them as the strings requests expects
         check_valid_methods(methods)
+        kwargs['methods'] = [m.value for m in methods]
 
         if not path.startswith('/'):
             path = '/' + path
 
         # Now register the route to the name
         self._endpoints[name] = \
-            FabricatorEndpoint(parent=self, **kwargs)
+            self._endpoint_class(parent=self, **kwargs)
         
         # Return self to allow calls to be chained
         return self
 
+
+Fabricator._group_class = Fabricator
@@ -1,14 +1,10 @@
-from typing import Callable, AnyStr, Optional, Any, Dict, List, Iterable, TYPE_CHECKING, Union
+from typing import Hashable, Tuple, Type, FrozenSet, Callable, AnyStr, Optional, Any, Dict, List, Iterable, TYPE_CHECKING, Union
+
+import enum
 
 import requests
-import six
 from requests.auth import AuthBase
 
-if six.PY2:
-    import aenum as enum
-elif six.PY3:
-    import enum
-
 
 if TYPE_CHECKING:
     # Types for annotations
@@ -18,7 +14,10 @@ if TYPE_CHECKING:
     DecodedJSON = Union[List, Dict, AnyStr, None]
     ResponseHandler = Callable[[requests.Response], Any]
 
-def quote_and_escape(s: AnyStr) -> AnyStr: ...
+_BODY_METHODS: FrozenSet[AnyStr]
+_MISSING: object
+
+def quote_and_escape(s: Optional[AnyStr]) -> str: ...
 
 class FabricatorException(Exception): ...
 class FabricatorNotImplementedError(FabricatorException): ...
@@ -46,8 +45,35 @@ class FabricatorRequestAuthError(FabricatorRequestError):
     def __init__(self, code: Optional[int]=None, content: Optional[AnyStr]=None): ...
 
 
+POOL_CONNECTIONS: int
+POOL_MAXSIZE: int
+
+def make_session() -> requests.Session: ...
+
+
+class AuthReady(AuthBase):
+    f: AuthFn
+    def __init__(self, f: AuthFn): ...
+    def __call__(self, req: Request) -> Request: ...
+
+def make_auth_handler(f: Union[AuthFn, AuthBase]) -> AuthBase: ...
+
+_NO_AUTH: AuthReady
+
+
+_CACHEABLE_METHODS: FrozenSet[AnyStr]
+
+class ResponseCache:
+    maxsize: int
+    ttl: Optional[float]
+    def __init__(self, maxsize: int, ttl: Optional[float]=None): ...
+    def get(self, key: Hashable) -> Any: ...
+    def put(self, key: Hashable, value: Any) -> None: ...
+    def clear(self) -> None: ...
+
+
 # HTTPMethods is used to ensure correct method names are being used when registering request methods and calling them
-class HTTPMethods(enum.Enum):
+class HTTPMethods(str, enum.Enum):
     """The set of valid HTTP methods"""
     # Most commonly used for REST APIs
     GET = 'GET'
@@ -62,22 +88,37 @@ class HTTPMethods(enum.Enum):
     CONNECT = 'CONNECT'
     TRACE = 'TRACE'
 
-    def __eq__(self, other: Any) -> bool: ...
-
     @staticmethod
-    def all() -> Iterable[AnyStr]: ...
+    def all() -> FrozenSet[AnyStr]: ...
+
+_HTTP_METHOD_NAMES: FrozenSet[AnyStr]
+_HTTP_METHOD_NAMES_LOWER: AnyStr
 
 # The FabricatorEndpoint type represents a particular 'path' and HTTP method (or route in ReST terms) that requests can be sent to.
 # This class actually makes the requests that occur in this library.
 class FabricatorEndpoint:
+    _state_slots: Tuple[AnyStr, ...]
     parent: 'Fabricator'
     path: AnyStr
     name: AnyStr
-    methods: List[HTTPMethods]
+    methods: List[AnyStr]
+    _methods_set: FrozenSet[AnyStr]
+    _required_params_set: FrozenSet[AnyStr]
+    _kwargs_option: Dict[AnyStr, AnyStr]
+    _cache: Optional[ResponseCache]
     auth_handler: AuthFn
     headers: Dict[AnyStr, AnyStr]
     handler: ResponseHandler
     required_params: List[AnyStr]
+    _url_param_names: Tuple[AnyStr, ...]
+    _url_param_tokens: Tuple[AnyStr, ...]
+    _path_template: AnyStr
+    _resolved: bool
+    _resolved_handler: Optional[ResponseHandler]
+    _resolved_auth: Optional[AuthBase]
+    _resolved_headers: Optional[Dict[AnyStr, AnyStr]]
+    _resolved_base_url: Optional[AnyStr]
+    _base_options: Optional[Dict[AnyStr, Any]]
 
     def __init__(self, *,
                  parent: 'Fabricator',
@@ -86,28 +127,45 @@ class FabricatorEndpoint:
                  handler: Optional[ResponseHandler]=None,
                  auth_handler: Optional[AuthFn]=None,
                  headers: Optional[Dict[AnyStr, AnyStr]]=None,
-                 methods: Optional[List[HTTPMethods]]=None,
-                 required_params: Optional[List[AnyStr]]=()): ...
+                 methods: Optional[List[AnyStr]]=None,
+                 required_params: Optional[List[AnyStr]]=(),
+                 cache: Optional[int]=None,
+                 cache_ttl: Optional[float]=None): ...
+    def _bind_methods(self) -> None: ...
+    def __getstate__(self) -> Tuple[None, Dict[AnyStr, Any]]: ...
+    def __setstate__(self, state: Tuple[None, Dict[AnyStr, Any]]) -> None: ...
     def __getattr__(self, item) -> Callable[[...], Any]: ...
     def __call__(self, *args: Any, **kwargs: Dict[AnyStr, Any]) -> ResponsePair: ...
-    def _check_method(self, m: Union[AnyStr, HTTPMethods]) -> None: ...
+    def _check_method(self, m: AnyStr) -> None: ...
     def _get_response_handler(self) -> ResponseHandler: ...
     def _get_auth_handler(self) -> AuthBase: ...
     def _get_headers(self) -> Dict[AnyStr, AnyStr]: ...
+    def _get_base_url(self) -> AnyStr: ...
+    def _resolve(self) -> None: ...
     def _construct_url(self, url_params: Dict[AnyStr, AnyStr]=None) -> AnyStr: ...
-    def _make_request(self, method: Union[AnyStr, HTTPMethods], **kwargs: Dict[AnyStr, Any]) -> ResponsePair: ...
+    def _make_request(self, method: AnyStr, **kwargs: Dict[AnyStr, Any]) -> ResponsePair: ...
+    def _cache_key(self, method: AnyStr, url: AnyStr, options: Dict[AnyStr, Any]) -> Optional[Hashable]: ...
+    def _cache_get(self, key: Optional[Hashable]) -> Any: ...
+    def _cache_put(self, key: Optional[Hashable], resp: requests.Response, result: Any) -> None: ...
+    def _prepare_request(self, method: AnyStr, **kwargs: Dict[AnyStr, Any]) -> (AnyStr, AnyStr, Dict[AnyStr, Any]): ...
 
 # The noop handler is the default if no other handler is provided. It is just a passthrough.
 def noop_response_handler(r: requests.Response) -> requests.Response: ...
 
 class Fabricator:
+    _endpoint_class: Type[FabricatorEndpoint]
+    _group_class: Type['Fabricator']
     _parent: 'Fabricator'
+    _root: 'Fabricator'
+    _chain: Tuple['Fabricator', ...]
     _base_url: AnyStr
     _auth_handler: AuthFn
     _headers: Dict
     _routes: Dict[AnyStr, Union['Fabricator', FabricatorEndpoint]]
     _default_handler: ResponseHandler
     _started: bool
+    _builders: Dict[AnyStr, Callable[..., 'Fabricator']]
+    _session: Optional[requests.Session]
 
     def __init__(self, *,
                  base_url: AnyStr,
@@ -129,9 +187,16 @@ class Fabricator:
     def add_header(self, *, name: AnyStr, value: AnyStr): ...
     def set_handler(self, h_: ResponseHandler): ...
     def set_auth_handler(self, h_: AuthFn): ...
-    def start(self): ...
+    def start(self, **kwargs: Any): ...
     def _is_started(self) -> bool: ...
     def _find_root(self) -> 'Fabricator': ...
+    def _resolve_endpoints(self) -> None: ...
+    def _start_session(self) -> None: ...
+    def _get_session(self) -> requests.Session: ...
+    def close(self, **kwargs: Any) -> Any: ...
+    def _close_session(self) -> None: ...
+    def __enter__(self) -> 'Fabricator': ...
+    def __exit__(self, *exc_info: Any) -> None: ...
     def register(self, *,
                  name: AnyStr,
                  path: AnyStr='',
@@ -139,4 +204,6 @@ class Fabricator:
                  methods: List[Union[AnyStr, HTTPMethods]]=None,
                  auth_handler: Optional[AuthFn]=None,
                  headers: Optional[Dict[AnyStr, AnyStr]]=None,
-                 required_params: Optional[List[AnyStr]]=()) -> 'Fabricator': ...
+                 required_params: Optional[List[AnyStr]]=(),
+                 cache: Optional[int]=None,
+                 cache_ttl: Optional[float]=None) -> 'Fabricator': ...
@@ -4,12 +4,15 @@ exclude_dirs = ['ez_setup', 'examples', 'tests', 'venv']
 
 # Runtime requirements
 reqs = [
-    'requests',
-    'six',
-    'future',
-    'aenum'
+    'requests'
 ]
 
+# Optional requirements
+extras = {
+    'aio': ['aiohttp'],
+    'json': ['orjson']
+}
+
 # Requirements for testing
 test_reqs = ['pytest', 'hypothesis', 'requests_mock']
 
@@ -25,15 +28,17 @@ setup(
     url='https://github.com/boichee/fabricator',
     packages=find_packages(exclude=exclude_dirs),
     install_requires=reqs,
+    extras_require=extras,
     tests_require=test_reqs,
     setup_requires=setup_reqs,
+    python_requires='>=3.8',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Operating System :: MacOS :: MacOS X',
         'Operating System :: POSIX',
         'Topic :: Software Development',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.8',
         'Intended Audience :: Developers'
     ]
 )
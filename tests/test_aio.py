@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from fabricator.aio import AsyncFabricator
+
+
+async def echo(request):
+    body = await request.json() if request.can_read_body else None
+    return web.json_response({
+        'method': request.method,
+        'path': request.path,
+        'query': dict(request.query),
+        'body': body,
+        'authorization': request.headers.get('Authorization'),
+        'cookie': request.headers.get('Cookie'),
+    })
+
+
+async def health(request):
+    return web.Response(text='OK')
+
+
+async def lines(request):
+    resp = web.Response(text='one\ntwo')
+    resp.headers.add('Set-Cookie', 'a=1')
+    resp.headers.add('Set-Cookie', 'b=2')
+    return resp
+
+
+async def login(request):
+    resp = web.Response(text='OK')
+    resp.set_cookie('sid', 'abc')
+    return resp
+
+
+async def secret(request):
+    return web.Response(status=401, text='Unauthorized')
+
+
+def make_app():
+    app = web.Application()
+    app.router.add_route('*', '/todos', echo)
+    app.router.add_route('*', '/todos/{id}', echo)
+    app.router.add_get('/__health', health)
+    app.router.add_get('/lines', lines)
+    app.router.add_get('/login', login)
+    app.router.add_get('/secret', secret)
+    return app
+
+
+# Runs the test body against a live aiohttp server, handing it a client pointed at that server
+def run(test):
+    async def main():
+        async with TestServer(make_app(), host='localhost') as server:
+            client = AsyncFabricator(base_url=str(server.make_url('')).rstrip('/'))
+            try:
+                return await test(client)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_requests():
+    from fabricator.extras import handler_json_decode
+
+    async def test(client):
+        client.set_handler(handler=handler_json_decode)
+        client.post(name='create', path='/todos')
+        client.start()
+
+        results = await asyncio.gather(*(client.create(value=v) for v in range(10)))
+        assert [data['body'] for data, _ in results] == [{'value': v} for v in range(10)]
+        assert all(status == 200 for _, status in results)
+
+    run(test)
+
+
+def test_query_and_body_routing():
+    from fabricator.extras import handler_json_decode
+
+    async def test(client):
+        client.set_handler(handler=handler_json_decode)
+        client.get(name='list', path='/todos')
+        client.post(name='create', path='/todos')
+        client.put(name='update', path='/todos/:id')
+        client.start()
+
+        data, _ = await client.list(done='true')
+        assert data['query'] == {'done': 'true'}
+        assert data['body'] is None
+
+        data, _ = await client.create(value='Thing to do')
+        assert data['query'] == {}
+        assert data['body'] == {'value': 'Thing to do'}
+
+        # URL params are filled in from kwargs and aren't sent in the body
+        data, _ = await client.update(id=1, value='Done')
+        assert data['path'] == '/todos/1'
+        assert data['body'] == {'value': 'Done'}
+
+    run(test)
+
+
+def test_auth_handler_applied():
+    from fabricator.extras import handler_json_decode
+
+    def auth(req):
+        req.headers['Authorization'] = 'Bearer token'
+        return req
+
+    async def test(client):
+        client.set_handler(handler=handler_json_decode)
+        client.set_auth_handler(handler=auth)
+        client.get(name='list', path='/todos')
+        client.start()
+
+        data, _ = await client.list()
+        assert data['authorization'] == 'Bearer token'
+
+    run(test)
+
+
+def test_bundled_handlers():
+    from fabricator.exc import FabricatorRequestAuthError
+    from fabricator.extras import handler_json_decode
+
+    async def test(client):
+        client.set_handler(handler=handler_json_decode)
+        client.get(name='health', path='/__health')
+        client.get(name='secret', path='/secret')
+        client.start()
+
+        # Non-JSON bodies come back as raw content, just as they do with Fabricator
+        assert await client.health() == (b'OK', 200)
+
+        with pytest.raises(FabricatorRequestAuthError):
+            await client.secret()
+
+    run(test)
+
+
+def test_async_response_handler():
+    async def handler(resp):
+        await asyncio.sleep(0)
+        return resp.status_code, resp.text
+
+    async def test(client):
+        client.set_handler(handler=handler)
+        client.get(name='health', path='/__health')
+        client.start()
+
+        assert await client.health() == (200, 'OK')
+
+    run(test)
+
+
+def test_response_works_like_requests():
+    async def test(client):
+        client.get(name='lines', path='/lines')
+        client.start()
+
+        resp = await client.lines()
+        assert list(resp.iter_lines()) == [b'one', b'two']
+        assert resp.headers['Set-Cookie'] == 'a=1, b=2'
+
+    run(test)
+
+
+def test_cookies_not_kept_between_calls():
+    from fabricator.extras import handler_json_decode
+
+    async def test(client):
+        client.get(name='login', path='/login')
+        client.get(name='list', path='/todos', handler=handler_json_decode)
+        client.start()
+
+        await client.login()
+        data, _ = await client.list()
+        assert data['cookie'] is None
+
+    run(test)
+
+
+def test_close_releases_session():
+    async def test(client):
+        client.get(name='health', path='/__health')
+        client.start()
+
+        async with client:
+            await client.health()
+            assert client._session is not None
+        assert client._session is None
+
+        # A new session is created if the client is used again
+        await client.health()
+        await client.close()
+        assert client._session is None
+
+    run(test)
+
+
+def test_sync_context_manager_rejected():
+    client = AsyncFabricator(base_url='http://localhost')
+    with pytest.raises(TypeError):
+        with client:
+            pass
+
+
+def test_groups_are_async():
+    client = AsyncFabricator(base_url='http://localhost')
+    assert type(client.group(name='todos', prefix='/todos')) is AsyncFabricator
+
+
+def test_start_outside_event_loop():
+    client = AsyncFabricator(base_url='http://localhost')
+    client.get(name='health', path='/__health')
+    client.start()
+
+    # The session is only created once there's a running event loop
+    assert client._session is None
+    assert client._endpoints['health']._resolved
@@ -88,6 +88,21 @@ def test_group_is_child(group, client):
     assert group._parent is client
 
 
+def test_group_on_subclass_with_own_init(m: requests_mock.Mocker):
+    class MyAPI(Fabricator):
+        def __init__(self, token):
+            super().__init__(base_url=BASE_URL, headers={'Authorization': 'Bearer ' + token})
+            self.group(name='todos', prefix='/todos').get(name='all', path='/')
+
+    client = MyAPI('token')
+    client.start()
+    assert type(client.todos) is Fabricator
+
+    m.get(BASE_URL + '/todos/', text='OK')
+    client.todos.all()
+    assert m.last_request.headers['Authorization'] == 'Bearer token'
+
+
 def test_group_can_have_registered_endpoints(client, group, m):
     group.get(name='test', path='/')
     assert 'test' in group._endpoints
@@ -138,6 +153,22 @@ def test_headers_sent_from_endpoint(client: Fabricator, m: requests_mock.Mocker)
     assert m.last_request.headers['X-CUSTOM'] == '1'
 
 
+def test_header_dict_changes_sent_after_start(m: requests_mock.Mocker):
+    headers = {'Authorization': 'Bearer old'}
+    client = Fabricator(base_url=BASE_URL, headers=headers)
+    client.get(name='health', path='/__health')
+    client.start()
+
+    m.get(HEALTH_TEST_URL, text='OK')
+    client.health()
+    assert m.last_request.headers['Authorization'] == 'Bearer old'
+
+    # Rotating the token in the configured dict applies to the next request
+    headers['Authorization'] = 'Bearer new'
+    client.health()
+    assert m.last_request.headers['Authorization'] == 'Bearer new'
+
+
 def test_direct_registration_with_multiple_methods(client: Fabricator, m: requests_mock.Mocker):
     # Add an endpoint using "register"
     client.register(name='update', path='/todos/:id', methods=['PUT', 'PATCH'])
@@ -212,3 +243,302 @@ def test_standard_api(client: Fabricator, m: requests_mock.Mocker):
     assert client.overwrite(id=1, name='user').status_code == 202
     assert client.update(id=1, name='user').status_code == 202
     assert client.delete(id=1).status_code == 204
+
+
+def test_session_shared_across_tree(client: Fabricator, group: Fabricator, m: requests_mock.Mocker):
+    client.get(name='health', path='/__health')
+    group.get(name='test', path='/')
+    client.start()
+
+    # The session lives on the root and is reused by groups
+    assert client._session is not None
+    assert group._get_session() is client._session
+
+    m.get(HEALTH_TEST_URL, text='OK')
+    m.get('{}/test/'.format(BASE_URL), text='OK')
+    assert client.health().status_code == 200
+    assert client.test.test().status_code == 200
+
+
+def test_json_decode_handler(client: Fabricator, m: requests_mock.Mocker):
+    from fabricator.extras import handler_json_decode
+    client.set_handler(handler=handler_json_decode)
+    client.get(name='todo', path='/todos/1')
+    client.get(name='health', path='/__health')
+    client.start()
+
+    m.get('{}/todos/1'.format(BASE_URL), json={'id': 1, 'value': 'Thing to do'})
+    m.get(HEALTH_TEST_URL, text='OK')
+
+    # JSON bodies are decoded, anything else is returned as raw content
+    assert client.todo() == ({'id': 1, 'value': 'Thing to do'}, 200)
+    assert client.health() == (b'OK', 200)
+
+
+def test_multiple_url_params(client: Fabricator, m: requests_mock.Mocker):
+    client.get(name='item', path='/lists/:list_id/items/:id')
+    client.start()
+
+    m.get('{}/lists/7/items/3'.format(BASE_URL), text='OK')
+
+    # URL params are substituted into the path, everything else goes in the query string
+    resp = client.item(list_id=7, id=3, verbose='1')
+    assert resp.status_code == 200
+    assert m.last_request.qs == {'verbose': ['1']}
+
+    from fabricator.exc import FabricatorParamValidationError
+    with pytest.raises(FabricatorParamValidationError):
+        client.item(id=3)
+
+
+def test_group_endpoints_resolved_at_start(client: Fabricator, group: Fabricator, m: requests_mock.Mocker):
+    # Settings come from the closest Fabricator in the tree that sets them
+    client.add_header(name='X-CUSTOM', value='1')
+    client.set_handler(handler=lambda resp: resp.text)
+    inner = group.group(name='inner', prefix='/inner')
+    inner.get(name='thing', path='/thing')
+    client.start()
+
+    endpoint = inner._endpoints['thing']
+    assert endpoint._resolved
+    assert endpoint._resolved_base_url == BASE_URL + '/test/inner'
+
+    m.get(BASE_URL + '/test/inner/thing', text='OK')
+    assert client.test.inner.thing() == 'OK'
+    assert m.last_request.headers['X-CUSTOM'] == '1'
+
+
+def test_call_before_start_not_cached(client: Fabricator, m: requests_mock.Mocker):
+    client.get(name='health', path='/__health')
+    m.get(HEALTH_TEST_URL, text='OK')
+
+    # Endpoints can be called directly before start(), which mustn't freeze their settings
+    endpoint = client._endpoints['health']
+    endpoint()
+    assert not endpoint._resolved
+
+    client.add_header(name='X-CUSTOM', value='1')
+    client.set_handler(handler=lambda resp: resp.text)
+    assert endpoint() == 'OK'
+    assert m.last_request.headers['X-CUSTOM'] == '1'
+
+    client.start()
+    assert endpoint._resolved
+
+
+def test_url_param_conversion_error_chained(client: Fabricator):
+    class Unprintable:
+        def __format__(self, spec):
+            raise ValueError('no')
+
+    client.get(name='todo', path='/todos/:id')
+    client.start()
+
+    from fabricator.exc import FabricatorUsageError
+    with pytest.raises(FabricatorUsageError) as info:
+        client.todo(id=Unprintable())
+    assert isinstance(info.value.__cause__, ValueError)
+
+
+def test_unregistered_method_on_endpoint(client: Fabricator):
+    client.get(name='health', path='/__health')
+    client.start()
+
+    from fabricator.exc import FabricatorNotImplementedError
+    with pytest.raises(FabricatorNotImplementedError):
+        client.health.post()
+
+
+def test_endpoint_can_be_copied(client: Fabricator, m: requests_mock.Mocker):
+    import copy
+    client.register(name='update', path='/todos/:id', methods=['PUT', 'PATCH'])
+    client.start()
+
+    endpoint = copy.copy(client.update)
+    assert endpoint.path == '/todos/:id'
+    assert 'put' in dir(endpoint)
+
+    # The copy's callers are bound to the copy, not the original
+    assert endpoint.put.func.__self__ is endpoint
+
+    m.put('{}/todos/1'.format(BASE_URL), text='OK')
+    assert endpoint.put(id=1).text == 'OK'
+
+
+def test_auth_handler_applied(client: Fabricator, m: requests_mock.Mocker):
+    def auth(req):
+        req.headers['Authorization'] = 'Bearer token'
+        return req
+
+    client.set_auth_handler(handler=auth)
+    client.get(name='health', path='/__health')
+    client.start()
+
+    m.get(HEALTH_TEST_URL, text='OK')
+    client.health()
+    client.health()
+    assert m.last_request.headers['Authorization'] == 'Bearer token'
+
+
+def test_start_from_group_starts_tree(client: Fabricator, group: Fabricator):
+    # An endpoint named like a HTTP method must not shadow the builder before start()
+    client.standard(with_param='id')
+    client.get(name='health', path='/__health')
+    assert 'health' in client._endpoints
+
+    group.start()
+    assert client._is_started() and group._is_started()
+
+
+def test_request_error_json_is_parsed_once():
+    from fabricator.exc import FabricatorRequestError
+    exc = FabricatorRequestError('Bad request', code=400, content=b'{"error": "bad"}')
+    assert exc.json == {'error': 'bad'}
+    assert exc.json is exc.json
+    assert 'bad' in str(exc)
+
+
+def test_get_responses_cached(client: Fabricator, m: requests_mock.Mocker):
+    client.get(name='todo', path='/todos/:id', cache=2)
+    client.get(name='fresh', path='/fresh', cache=2)
+    client.start()
+
+    m.get('{}/todos/1'.format(BASE_URL), text='OK')
+    m.get('{}/todos/2'.format(BASE_URL), text='OK')
+    m.get('{}/fresh'.format(BASE_URL), text='OK', headers={'Cache-Control': 'no-store'})
+
+    first = client.todo(id=1)
+    assert client.todo(id=1) is first
+    assert m.call_count == 1
+
+    # Different params are cached separately
+    client.todo(id=1, q='x')
+    client.todo(id=2)
+    assert m.call_count == 3
+
+    # The cache only holds 2 entries, so the first call has been evicted
+    assert client.todo(id=1) is not first
+    assert m.call_count == 4
+
+    # no-store responses are never cached
+    client.fresh()
+    client.fresh()
+    assert m.call_count == 6
+
+
+def test_cache_requires_cacheable_method(client: Fabricator):
+    from fabricator.exc import FabricatorUsageError
+    with pytest.raises(FabricatorUsageError):
+        client.post(name='create', path='/todos', cache=10)
+
+
+def test_endpoint_settings_override_resolved_tree(client: Fabricator, group: Fabricator, m: requests_mock.Mocker):
+    client.add_header(name='X-CUSTOM', value='1')
+    group.set_handler(handler=lambda resp: 'group')
+    group.get(name='inherits', path='/inherits')
+    group.get(name='overrides', path='/overrides', headers={'X-CUSTOM': '2'}, handler=lambda resp: 'endpoint')
+    client.start()
+
+    m.get(BASE_URL + '/test/inherits', text='OK')
+    m.get(BASE_URL + '/test/overrides', text='OK')
+
+    assert client.test.inherits() == 'group'
+    assert m.last_request.headers['X-CUSTOM'] == '1'
+    assert client.test.overrides() == 'endpoint'
+    assert m.last_request.headers['X-CUSTOM'] == '2'
+
+
+def test_close_releases_session(client: Fabricator, m: requests_mock.Mocker):
+    client.get(name='health', path='/__health')
+    client.start()
+
+    m.get(HEALTH_TEST_URL, text='OK')
+    with client:
+        assert client.health().status_code == 200
+    assert client._session is None
+
+    # A closed client opens a new session if it is used again
+    assert client.health().status_code == 200
+    client.close()
+    assert client._session is None
+
+
+def test_cookies_not_kept_between_calls():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    # requests_mock doesn't put cookies in the session, so this runs against a real server
+    sent = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            sent.append(self.headers.get('Cookie'))
+            self.send_response(200)
+            if self.path == '/login':
+                self.send_header('Set-Cookie', 'sid=abc; Path=/')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = Fabricator(base_url='http://127.0.0.1:{}'.format(server.server_port))
+        client.get(name='login', path='/login')
+        client.get(name='me', path='/me')
+        client.start()
+
+        with client:
+            client.login()
+            client.me()
+        assert sent == [None, None]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_http_methods_compare_as_strings():
+    from fabricator.fabricator import HTTPMethods
+    assert HTTPMethods.GET == 'GET'
+    assert 'POST' in {HTTPMethods.POST}
+    assert HTTPMethods.PUT in frozenset(('PUT',))
+
+
+def test_auth_base_instance_used_directly(client: Fabricator, m: requests_mock.Mocker):
+    from requests.auth import HTTPBasicAuth
+    auth = HTTPBasicAuth('user', 'pass')
+    client.get(name='health', path='/__health', auth_handler=auth)
+    client.start()
+
+    m.get(HEALTH_TEST_URL, text='OK')
+    client.health()
+    assert client._endpoints['health']._resolved_auth is auth
+    assert m.last_request.headers['Authorization'].startswith('Basic ')
+
+
+def test_request_error_non_json_content():
+    from fabricator.exc import FabricatorRequestError
+    assert FabricatorRequestError('Bad request', code=400, content=b'not json').json == b'not json'
+    assert FabricatorRequestError('Bad request', code=400).json is None
+
+
+def test_request_error_repr():
+    from fabricator.exc import FabricatorRequestError, FabricatorParamValidationError
+    exc = FabricatorRequestError("It's broken", code=500, content=b'{"error": "bad"}')
+    assert repr(exc) == 'FabricatorRequestError("It\'s broken", code=500, content=b\'{"error": "bad"}\')'
+    assert repr(FabricatorRequestError()) == 'FabricatorRequestError(None, code=None, content=None)'
+    assert repr(FabricatorParamValidationError(param=':id')) == "FabricatorParamValidationError(param=':id')"
+
+
+def test_error_responses_not_cached(client: Fabricator, m: requests_mock.Mocker):
+    client.get(name='todo', path='/todos/:id', cache=2)
+    client.start()
+
+    m.get('{}/todos/1'.format(BASE_URL), [{'status_code': 500}, {'status_code': 200, 'text': 'OK'}])
+
+    # The 500 isn't cached, so the next call reaches the API and gets the 200, which is cached
+    assert client.todo(id=1).status_code == 500
+    assert client.todo(id=1).status_code == 200
+    assert client.todo(id=1).status_code == 200
+    assert m.call_count == 2